@@ -3,31 +3,65 @@ Weather API routes.
 This demonstrates proper importing from nested service modules.
 """
 
-from typing import Any
-
-from fastapi import APIRouter, HTTPException, Query
+import msgspec
+from fastapi import APIRouter, Header, Query, Response
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
+from app.core.http_cache import StaticJSON
+from app.models.weather import (
+    ApiInfoResponse,
+    HeatIndexBatchRequest,
+    HeatIndexBatchResponse,
+    HeatIndexResponse,
+    WeatherResponse,
+)
 
 # Example of importing from deeply nested module structure
 # Note: We use absolute imports starting from 'app'
 from app.services.weather_service import weather_service
 
 # Create a router instance
+# All handlers are ``async def`` on purpose: they only do in-memory work, so
+# running them on the event loop avoids a threadpool hop per request.
+# Handlers that return a pre-encoded Response bypass response_model entirely,
+# so there it only documents the schema. The rest return Pydantic models,
+# which pydantic-core serializes with a precompiled schema.
 router = APIRouter(
     prefix="/weather",
     tags=["weather"],
 )
 
+# City list and API info never change while the process runs, so their
+# response bodies and caching headers are built once at import time
+_CITIES = StaticJSON(
+    weather_service.get_available_cities(), max_age=settings.cache_max_age
+)
+_INFO = StaticJSON(
+    {
+        "app_name": settings.app_name,
+        "version": settings.api_version,
+        "debug_mode": str(settings.debug),
+    },
+    max_age=settings.cache_max_age,
+)
+
+# Reused msgspec encoder for WeatherOut responses
+_weather_encoder = msgspec.json.Encoder()
 
-@router.get("/", response_model=dict[str, Any])
+
+@router.get(
+    "/",
+    response_model=WeatherResponse,
+    responses={404: {"description": "Weather data not found for the city"}},
+)
 async def get_weather(
     city: str = Query(
         ...,
         description="Name of the city to get weather for",
         examples=["New York", "London", "Tokyo"],
     ),
-) -> dict[str, Any]:
+) -> Response:
     """
     Get current weather for a specific city.
 
@@ -35,43 +69,52 @@ async def get_weather(
     - Proper import from services module
     - Query parameter validation
     - Error handling
-    - Response model typing
+    - Typed response model for documentation
 
     Args:
         city: Name of the city
 
     Returns:
-        Weather information dictionary
-
-    Raises:
-        HTTPException: 404 if city not found
+        Weather information encoded with msgspec, or a 404 response if the
+        city is not found
     """
-    try:
-        # Call the service layer (imported from app.services.weather_service)
-        weather_data = weather_service.get_weather(city)
-        return weather_data
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e)) from e
+    # Call the service layer (imported from app.services.weather_service)
+    weather_data = weather_service.get_weather(city)
+
+    if weather_data is None:
+        # Plain response instead of HTTPException: no raise/unwind per miss
+        return ORJSONResponse(
+            {"detail": f"Weather data not found for city: {city}"}, status_code=404
+        )
+
+    return Response(
+        content=_weather_encoder.encode(weather_data), media_type="application/json"
+    )
 
 
 @router.get("/cities", response_model=list[str])
-async def get_available_cities() -> list[str]:
+async def get_available_cities(
+    if_none_match: str | None = Header(default=None),
+) -> Response:
     """
     Get list of cities with available weather data.
 
+    Args:
+        if_none_match: ETag of the client's cached copy, if any
+
     Returns:
-        List of city names
+        Pre-encoded JSON list of city names with caching headers
     """
-    return weather_service.get_available_cities()
+    return _CITIES.response(if_none_match)
 
 
-@router.get("/heat-index", response_model=dict[str, float])
+@router.get("/heat-index", response_model=HeatIndexResponse)
 async def calculate_heat_index(
     temperature: float = Query(
         ..., description="Temperature in Fahrenheit", ge=-50, le=150
     ),
     humidity: float = Query(..., description="Humidity percentage", ge=0, le=100),
-) -> dict[str, float]:
+) -> HeatIndexResponse:
     """
     Calculate heat index from temperature and humidity.
 
@@ -84,24 +127,50 @@ async def calculate_heat_index(
         humidity: Humidity percentage
 
     Returns:
-        Dictionary with heat index value
+        Heat index value with its inputs
     """
     heat_index = weather_service.calculate_heat_index(temperature, humidity)
-    return {"temperature": temperature, "humidity": humidity, "heat_index": heat_index}
+    return HeatIndexResponse(
+        temperature=temperature, humidity=humidity, heat_index=heat_index
+    )
 
 
-@router.get("/info", response_model=dict[str, str])
-async def get_api_info() -> dict[str, str]:
+@router.post("/heat-index/batch", response_model=HeatIndexBatchResponse)
+async def calculate_heat_index_batch(
+    request: HeatIndexBatchRequest,
+) -> HeatIndexBatchResponse:
+    """
+    Calculate heat indices for a batch of readings.
+
+    Demonstrates:
+    - Request body validation with a Pydantic model
+    - Amortizing per-request overhead across many data points
+
+    Args:
+        request: Paired lists of temperatures and humidities
+
+    Returns:
+        Heat index values, in input order
+    """
+    heat_indices = weather_service.calculate_heat_index_batch(
+        request.temperatures, request.humidities
+    )
+    return HeatIndexBatchResponse(heat_indices=heat_indices)
+
+
+@router.get("/info", response_model=ApiInfoResponse)
+async def get_api_info(
+    if_none_match: str | None = Header(default=None),
+) -> Response:
     """
     Get API information.
 
     Demonstrates importing and using configuration from app.core.config
 
+    Args:
+        if_none_match: ETag of the client's cached copy, if any
+
     Returns:
-        API information dictionary
+        Pre-encoded JSON API information dictionary with caching headers
     """
-    return {
-        "app_name": settings.app_name,
-        "version": settings.api_version,
-        "debug_mode": str(settings.debug),
-    }
+    return _INFO.response(if_none_match)
@@ -3,6 +3,10 @@ Core configuration module using pydantic-settings.
 This demonstrates best practices for FastAPI configuration management.
 """
 
+import os
+from functools import lru_cache
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,12 +19,22 @@ class Settings(BaseSettings):
         debug: Debug mode flag
         api_version: API version string
         max_temperature: Maximum temperature threshold (dummy config)
+        workers: Number of uvicorn worker processes (defaults to CPU count)
+        threadpool_size: Thread limit for sync endpoints and run_in_threadpool
+        cors_enabled: Whether to add the CORS middleware at all
+        cors_allow_origins: Origins allowed to make cross-origin requests
+        cache_max_age: Seconds clients and CDNs may cache static responses
     """
 
     app_name: str = "Weather API"
     debug: bool = False
     api_version: str = "v1"
     max_temperature: float = 100.0
+    workers: int = Field(default_factory=lambda: os.cpu_count() or 1, ge=1)
+    threadpool_size: int = Field(default=40, ge=1)
+    cors_enabled: bool = False
+    cors_allow_origins: list[str] = []
+    cache_max_age: int = Field(default=3600, ge=0)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -29,5 +43,21 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+
+    Cached so every caller shares one instance. ``create_app()`` reads
+    settings through this function, so after ``get_settings.cache_clear()``
+    a newly built app picks up a changed environment. Values that modules
+    read at import time, like the pre-encoded weather info, do not change.
+
+    Returns:
+        Application settings
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
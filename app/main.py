@@ -3,69 +3,139 @@ Main FastAPI application.
 This is the entry point that ties all modules together.
 """
 
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+from fastapi import FastAPI, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import router from nested routes module
 # This demonstrates importing from app.api.routes.weather
 from app.api.routes import weather
-from app.core.config import settings
-
-# Create FastAPI application instance
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.api_version,
-    debug=settings.debug,
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-# Include routers from api.routes module
-# This shows how to organize routes in separate modules
-app.include_router(weather.router, prefix="/api/v1")
-
-
-@app.get("/")
-async def root():
+from app.core.config import get_settings
+from app.core.http_cache import StaticJSON
+
+settings = get_settings()
+
+# The health body never changes, so encode it once at import time
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan: runs once per worker on startup and shutdown.
+
+    Sizes anyio's default thread limiter, which backs sync endpoints and
+    run_in_threadpool calls, from the settings the app was built with.
     """
-    Root endpoint - simple health check.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = app.state.settings.threadpool_size
+    yield
+
 
-    This is the minimal GET route requested.
-    For more complex routes, see /api/v1/weather endpoints.
+async def health_check() -> Response:
+    """
+    Health check endpoint for monitoring.
 
     Returns:
-        Simple welcome message
+        Pre-encoded health status
     """
-    return {
-        "message": f"Welcome to {settings.app_name}",
-        "version": settings.api_version,
-        "docs": "/docs",
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/health")
-async def health_check():
+def create_app() -> FastAPI:
     """
-    Health check endpoint for monitoring.
+    Build and configure the FastAPI application.
+
+    Settings are read through get_settings() on every call, so a new app
+    reflects the settings current at build time.
 
     Returns:
-        Health status
+        Configured FastAPI application
     """
-    return {"status": "healthy"}
+    settings = get_settings()
+
+    # Create FastAPI application instance
+    app = FastAPI(
+        title=settings.app_name,
+        version=settings.api_version,
+        debug=settings.debug,
+        # Interactive docs and the OpenAPI schema are only served in debug mode
+        docs_url="/docs" if settings.debug else None,
+        redoc_url="/redoc" if settings.debug else None,
+        openapi_url="/openapi.json" if settings.debug else None,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+    app.state.settings = settings
+
+    # The root body depends on this app's settings, so encode it once per app
+    root_body = StaticJSON(
+        {
+            "message": f"Welcome to {settings.app_name}",
+            "version": settings.api_version,
+            "docs": app.docs_url,
+        },
+        max_age=settings.cache_max_age,
+    )
+
+    async def root(if_none_match: str | None = Header(default=None)) -> Response:
+        """
+        Root endpoint - simple health check.
+
+        This is the minimal GET route requested.
+        For more complex routes, see /api/v1/weather endpoints.
+
+        Args:
+            if_none_match: ETag of the client's cached copy, if any
+
+        Returns:
+            Pre-encoded welcome message with caching headers
+        """
+        return root_body.response(if_none_match)
+
+    # Add CORS middleware only when browsers call the API directly; behind a
+    # gateway it would just add a middleware layer to every request
+    if settings.cors_enabled:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.cors_allow_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # Compress larger responses; small payloads are not worth the CPU
+    app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
+    # Include routers from api.routes module
+    # This shows how to organize routes in separate modules
+    app.include_router(weather.router, prefix="/api/v1")
+
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/health", health_check, methods=["GET"])
+
+    return app
+
+
+app = create_app()
 
 
 # This allows running with `python -m app.main` for development
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=settings.debug)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=settings.debug,
+        # Multiple workers cannot be combined with auto-reload
+        workers=1 if settings.debug else settings.workers,
+    )
@@ -0,0 +1,122 @@
+"""
+Weather data models.
+This demonstrates keeping request and response shapes in their own module.
+"""
+
+from typing import Annotated, Self
+
+import msgspec
+from pydantic import BaseModel, Field, model_validator
+
+# Bounds match the query parameter validation on GET /heat-index
+Temperature = Annotated[float, Field(ge=-50, le=150)]
+Humidity = Annotated[float, Field(ge=0, le=100)]
+
+
+class WeatherOut(msgspec.Struct, omit_defaults=True, gc=False):
+    """
+    Weather information for a single city.
+
+    Encoded with msgspec, which serializes fixed-shape structs faster than
+    generic dicts. ``warning`` is omitted from the JSON output when unset.
+
+    Attributes:
+        temp: Temperature in Fahrenheit
+        humidity: Humidity percentage
+        condition: Short description of the conditions
+        city: Name of the city
+        timestamp: ISO 8601 time the data was served
+        warning: Optional temperature warning
+    """
+
+    temp: float
+    humidity: int
+    condition: str
+    city: str
+    timestamp: str
+    warning: str | None = None
+
+
+class WeatherResponse(BaseModel):
+    """
+    Documented schema for the weather endpoint.
+
+    The endpoint encodes ``WeatherOut`` directly; this model mirrors it so
+    the OpenAPI schema describes the same fields.
+
+    Attributes:
+        temp: Temperature in Fahrenheit
+        humidity: Humidity percentage
+        condition: Short description of the conditions
+        city: Name of the city
+        timestamp: ISO 8601 time the data was served
+        warning: Temperature warning, only present when triggered
+    """
+
+    temp: float
+    humidity: int
+    condition: str
+    city: str
+    timestamp: str
+    warning: str | None = None
+
+
+class HeatIndexResponse(BaseModel):
+    """
+    Heat index for a single temperature/humidity reading.
+
+    Attributes:
+        temperature: Temperature in Fahrenheit
+        humidity: Humidity percentage
+        heat_index: Calculated heat index
+    """
+
+    temperature: float
+    humidity: float
+    heat_index: float
+
+
+class HeatIndexBatchRequest(BaseModel):
+    """
+    Request body for calculating many heat indices in one call.
+
+    Attributes:
+        temperatures: Temperatures in Fahrenheit
+        humidities: Humidity percentages, paired by position with temperatures
+    """
+
+    temperatures: list[Temperature] = Field(..., min_length=1, max_length=1000)
+    humidities: list[Humidity] = Field(..., min_length=1, max_length=1000)
+
+    @model_validator(mode="after")
+    def check_lengths_match(self) -> Self:
+        """Ensure every temperature has a matching humidity."""
+        if len(self.temperatures) != len(self.humidities):
+            raise ValueError("temperatures and humidities must have the same length")
+        return self
+
+
+class HeatIndexBatchResponse(BaseModel):
+    """
+    Heat indices for a batch of readings.
+
+    Attributes:
+        heat_indices: Calculated heat indices, in input order
+    """
+
+    heat_indices: list[float]
+
+
+class ApiInfoResponse(BaseModel):
+    """
+    API information.
+
+    Attributes:
+        app_name: Name of the application
+        version: API version string
+        debug_mode: Debug mode flag as a string
+    """
+
+    app_name: str
+    version: str
+    debug_mode: str
@@ -3,55 +3,133 @@ Weather service module containing business logic.
 This demonstrates how to organize service/business logic layer.
 """
 
+import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import TypedDict
 
 # Import from core configuration module (example of cross-module import)
 from app.core.config import settings
+from app.models.weather import WeatherOut
+
+
+class _CityWeather(TypedDict):
+    """Stored weather readings for one city."""
+
+    temp: float
+    humidity: int
+    condition: str
+
+
+def _heat_index(temperature: float, humidity: float) -> float:
+    """
+    Heat index kernel shared by the scalar and batch calculations.
+
+    Kept as a plain module-level function: the formula is a single
+    multiply-add, so a JIT or memoization layer would cost more per call
+    than the arithmetic itself.
+
+    Args:
+        temperature: Temperature in Fahrenheit
+        humidity: Humidity percentage
+
+    Returns:
+        Unrounded heat index
+    """
+    # Simplified dummy calculation
+    return temperature + (humidity * 0.5)
 
 
 class WeatherService:
     """
     Service class for weather-related business logic.
     This is dummy logic to demonstrate proper module organization.
+
+    The weather routes are ``async def`` and call these methods directly on
+    the event loop, so every method here must stay pure CPU work with no
+    blocking I/O. If a real weather provider is added later, call it with
+    ``httpx.AsyncClient`` from an async method (or wrap blocking code in
+    ``run_in_threadpool``) instead of using a blocking client like
+    ``requests``.
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the weather service with some dummy data."""
-        self._weather_data = {
+        self._weather_data: dict[str, _CityWeather] = {
             "New York": {"temp": 72.5, "humidity": 65, "condition": "Partly Cloudy"},
             "London": {"temp": 59.0, "humidity": 78, "condition": "Rainy"},
             "Tokyo": {"temp": 68.3, "humidity": 55, "condition": "Sunny"},
             "Sydney": {"temp": 77.9, "humidity": 60, "condition": "Clear"},
         }
+        # Per-city (temp, humidity, condition, warning) tuples, precomputed
+        # once so a request does a single lookup and no threshold check.
+        self._lookup: dict[str, tuple[float, int, str, str | None]] = {
+            name: (
+                data["temp"],
+                data["humidity"],
+                data["condition"],
+                self._temperature_warning(data["temp"]),
+            )
+            for name, data in self._weather_data.items()
+        }
+        # (epoch second, ISO string) of the last formatted timestamp
+        self._timestamp_cache: tuple[int, str] = (-1, "")
 
-    def get_weather(self, city: str) -> dict[str, Any]:
+    def get_weather(self, city: str) -> WeatherOut | None:
         """
         Get weather information for a specific city.
 
+        Unknown cities are reported by returning None rather than raising,
+        since clients probing invalid names can make misses common.
+
         Args:
             city: Name of the city
 
         Returns:
-            Dictionary containing weather information
+            Weather information struct, or None if the city is not found
+        """
+        entry = self._lookup.get(city)
+
+        if entry is None:
+            return None
+
+        # Build a fresh struct so the shared city data is never mutated
+        temp, humidity, condition, warning = entry
+        return WeatherOut(
+            temp, humidity, condition, city, self._current_timestamp(), warning
+        )
 
-        Raises:
-            ValueError: If city is not found
+    @staticmethod
+    def _temperature_warning(temp: float) -> str | None:
         """
-        weather = self._weather_data.get(city)
+        Get the warning for a temperature, if any.
 
-        if not weather:
-            raise ValueError(f"Weather data not found for city: {city}")
+        Args:
+            temp: Temperature in Fahrenheit
 
+        Returns:
+            Warning message, or None if the temperature is within limits
+        """
         # Use config to validate temperature (example of using config in service)
-        if weather["temp"] > settings.max_temperature:
-            weather["warning"] = "Temperature exceeds maximum threshold!"
+        if temp > settings.max_temperature:
+            return "Temperature exceeds maximum threshold!"
+        return None
+
+    def _current_timestamp(self) -> str:
+        """
+        Get the current UTC time as an ISO 8601 string with second resolution.
 
-        # Add metadata
-        weather["timestamp"] = datetime.now(UTC).isoformat()
-        weather["city"] = city
+        The formatted string is cached and only rebuilt when the wall-clock
+        second changes, which avoids a datetime allocation per request.
 
-        return weather
+        Returns:
+            ISO 8601 timestamp
+        """
+        now = int(time.time())
+        cached_second, cached_iso = self._timestamp_cache
+        if now != cached_second:
+            cached_iso = datetime.fromtimestamp(now, tz=UTC).isoformat()
+            self._timestamp_cache = (now, cached_iso)
+        return cached_iso
 
     def get_available_cities(self) -> list[str]:
         """
@@ -73,9 +151,29 @@ class WeatherService:
         Returns:
             Calculated heat index
         """
-        # Simplified dummy calculation
-        heat_index = temperature + (0.5 * humidity)
-        return round(heat_index, 2)
+        return round(_heat_index(temperature, humidity), 2)
+
+    def calculate_heat_index_batch(
+        self, temperatures: list[float], humidities: list[float]
+    ) -> list[float]:
+        """
+        Calculate heat indices for many temperature/humidity pairs at once.
+
+        Uses the same kernel and rounding as calculate_heat_index, so each
+        result matches the single-value endpoint; the saving is one HTTP
+        round-trip and validation pass for the whole batch.
+
+        Args:
+            temperatures: Temperatures in Fahrenheit
+            humidities: Humidity percentages, same length as temperatures
+
+        Returns:
+            Calculated heat indices, in input order
+        """
+        return [
+            round(_heat_index(temperature, humidity), 2)
+            for temperature, humidity in zip(temperatures, humidities, strict=True)
+        ]
 
 
 # Create a singleton instance that can be imported
@@ -0,0 +1,16 @@
+"""
+Build script that compiles the weather service with mypyc.
+
+Project metadata lives in pyproject.toml; this file only adds the
+compiled extension. Building (``pip install .`` or
+``python setup.py build_ext --inplace``) produces a C extension that is
+imported in place of app/services/weather_service.py. Without a build,
+the pure-Python module is used as before.
+"""
+
+from mypyc.build import mypycify
+from setuptools import setup
+
+setup(
+    ext_modules=mypycify(["--strict", "app/services/weather_service.py"]),
+)
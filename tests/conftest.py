@@ -10,13 +10,14 @@ from fastapi.testclient import TestClient
 from app.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
     """
     Create a test client for the FastAPI application.
 
     This fixture can be used in any test function by including
-    'client' as a parameter.
+    'client' as a parameter. It is session-scoped so the app's lifespan
+    starts once for the whole run; tests must not leave app state modified.
 
     Yields:
         TestClient: FastAPI test client
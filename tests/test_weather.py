@@ -3,7 +3,10 @@ Tests for weather API endpoints.
 Demonstrates pytest best practices for FastAPI testing.
 """
 
+import inspect
+
 import pytest
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
 
@@ -17,6 +20,44 @@ def test_root_endpoint(client: TestClient):
     assert data["version"] == "v1"
 
 
+def test_docs_only_served_in_debug(monkeypatch: pytest.MonkeyPatch):
+    """Test that docs and the OpenAPI schema are gated on debug mode."""
+    from app.core.config import get_settings
+    from app.main import create_app
+
+    settings = get_settings()
+
+    monkeypatch.setattr(settings, "debug", False)
+    prod_client = TestClient(create_app())
+    assert prod_client.get("/docs").status_code == 404
+    assert prod_client.get("/").json()["docs"] is None
+
+    monkeypatch.setattr(settings, "debug", True)
+    debug_client = TestClient(create_app())
+    assert debug_client.get("/docs").status_code == 200
+    assert debug_client.get("/openapi.json").status_code == 200
+    assert debug_client.get("/").json()["docs"] == "/docs"
+
+
+def test_cors_only_when_enabled(monkeypatch: pytest.MonkeyPatch):
+    """Test that CORS headers are only added for configured origins."""
+    from app.core.config import get_settings
+    from app.main import create_app
+
+    settings = get_settings()
+
+    origin = {"Origin": "https://example.com"}
+
+    monkeypatch.setattr(settings, "cors_enabled", False)
+    response = TestClient(create_app()).get("/health", headers=origin)
+    assert "access-control-allow-origin" not in response.headers
+
+    monkeypatch.setattr(settings, "cors_enabled", True)
+    monkeypatch.setattr(settings, "cors_allow_origins", ["https://example.com"])
+    response = TestClient(create_app()).get("/health", headers=origin)
+    assert response.headers["access-control-allow-origin"] == "https://example.com"
+
+
 def test_health_check(client: TestClient):
     """Test health check endpoint."""
     response = client.get("/health")
@@ -34,13 +75,14 @@ def test_get_weather_valid_city(client: TestClient):
     assert "humidity" in data
     assert "condition" in data
     assert "timestamp" in data
+    assert "warning" not in data
 
 
 def test_get_weather_invalid_city(client: TestClient):
     """Test getting weather for an invalid city returns 404."""
     response = client.get("/api/v1/weather/?city=InvalidCity")
     assert response.status_code == 404
-    assert "detail" in response.json()
+    assert response.json() == {"detail": "Weather data not found for city: InvalidCity"}
 
 
 def test_get_available_cities(client: TestClient):
@@ -74,6 +116,71 @@ def test_calculate_heat_index_invalid_params(client: TestClient):
     assert response.status_code == 422
 
 
+def test_calculate_heat_index_batch(client: TestClient):
+    """Test batch heat index matches the single-value endpoint."""
+    # (58.12, 39.13) rounds differently with np.round than with round()
+    pairs = [(75, 60), (90.5, 33.3), (58.12, 39.13), (-12.345, 0.01), (150, 100)]
+    response = client.post(
+        "/api/v1/weather/heat-index/batch",
+        json={
+            "temperatures": [t for t, _ in pairs],
+            "humidities": [h for _, h in pairs],
+        },
+    )
+    assert response.status_code == 200
+    heat_indices = response.json()["heat_indices"]
+    assert len(heat_indices) == len(pairs)
+
+    for (temperature, humidity), heat_index in zip(pairs, heat_indices, strict=True):
+        single = client.get(
+            "/api/v1/weather/heat-index",
+            params={"temperature": temperature, "humidity": humidity},
+        )
+        assert heat_index == single.json()["heat_index"]
+
+
+def test_large_responses_are_compressed(client: TestClient):
+    """Test that responses above the size threshold are gzip-compressed."""
+    response = client.post(
+        "/api/v1/weather/heat-index/batch",
+        json={"temperatures": [75.5] * 200, "humidities": [60.5] * 200},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["heat_indices"]) == 200
+
+
+def test_calculate_heat_index_batch_invalid_body(client: TestClient):
+    """Test batch heat index rejects mismatched or out-of-range input."""
+    # Mismatched lengths
+    response = client.post(
+        "/api/v1/weather/heat-index/batch",
+        json={"temperatures": [75, 80], "humidities": [60]},
+    )
+    assert response.status_code == 422
+
+    # Humidity out of range
+    response = client.post(
+        "/api/v1/weather/heat-index/batch",
+        json={"temperatures": [75], "humidities": [150]},
+    )
+    assert response.status_code == 422
+
+
+def test_static_responses_are_cacheable(client: TestClient):
+    """Test that constant responses carry caching headers and honor ETags."""
+    for path in ["/", "/api/v1/weather/cities", "/api/v1/weather/info"]:
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("public, max-age=")
+        etag = response.headers["etag"]
+
+        cached = client.get(path, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+
 def test_get_api_info(client: TestClient):
     """Test API info endpoint."""
     response = client.get("/api/v1/weather/info")
@@ -103,6 +210,112 @@ def test_weather_service_heat_index():
     assert heat_index > 0
 
 
+def test_weather_routes_are_async():
+    """Test that weather routes run on the event loop, not in the threadpool."""
+    from app.api.routes.weather import router
+
+    for route in router.routes:
+        assert isinstance(route, APIRoute)
+        assert inspect.iscoroutinefunction(route.endpoint), route.path
+
+
+def test_weather_service_unknown_city():
+    """Test that the service reports unknown cities with None."""
+    from app.services.weather_service import weather_service
+
+    assert weather_service.get_weather("Atlantis") is None
+
+
+def test_weather_service_timestamp():
+    """Test that weather timestamps are timezone-aware ISO strings."""
+    from datetime import datetime
+
+    from app.services.weather_service import weather_service
+
+    timestamp = weather_service.get_weather("London").timestamp
+    assert datetime.fromisoformat(timestamp).utcoffset() is not None
+
+
+def test_weather_service_does_not_mutate_data():
+    """Test that get_weather builds a new result instead of mutating stored data."""
+    from app.services.weather_service import weather_service
+
+    first = weather_service.get_weather("Tokyo")
+    first.temp = -1.0
+    assert weather_service.get_weather("Tokyo").temp != -1.0
+    assert "city" not in weather_service._weather_data["Tokyo"]
+
+
+def test_weather_service_temperature_warning():
+    """Test that only temperatures above the configured maximum warn."""
+    from app.core.config import settings
+    from app.services.weather_service import WeatherService
+
+    assert WeatherService._temperature_warning(settings.max_temperature) is None
+    assert WeatherService._temperature_warning(settings.max_temperature + 1)
+
+
+def test_create_app_reads_current_settings(monkeypatch: pytest.MonkeyPatch):
+    """Test that the factory picks up settings reloaded from the environment."""
+    from app.core.config import get_settings
+    from app.main import create_app
+
+    monkeypatch.setenv("DEBUG", "true")
+    get_settings.cache_clear()
+    try:
+        assert create_app().docs_url == "/docs"
+    finally:
+        get_settings.cache_clear()
+
+
+def test_create_app_reads_current_cache_max_age(monkeypatch: pytest.MonkeyPatch):
+    """Test that the root cache header follows settings reloaded at build time."""
+    from app.core.config import get_settings
+    from app.main import create_app
+
+    monkeypatch.setenv("CACHE_MAX_AGE", "60")
+    get_settings.cache_clear()
+    try:
+        response = TestClient(create_app()).get("/")
+    finally:
+        get_settings.cache_clear()
+    assert response.headers["cache-control"] == "public, max-age=60, immutable"
+
+
+def test_create_app_builds_independent_apps():
+    """Test that the app factory returns a fresh, fully routed app."""
+    from app.main import app, create_app
+
+    new_app = create_app()
+    assert new_app is not app
+    paths = {route.path for route in new_app.routes}
+    assert {"/", "/health", "/api/v1/weather/"} <= paths
+
+
+def test_threadpool_size_applied_on_startup(monkeypatch: pytest.MonkeyPatch):
+    """Test that the lifespan sizes the threadpool from settings."""
+    import anyio.to_thread
+
+    from app.core.config import get_settings
+    from app.main import create_app
+
+    settings = get_settings()
+
+    monkeypatch.setattr(settings, "threadpool_size", 7)
+    with TestClient(create_app()) as test_client:
+        total_tokens = test_client.portal.call(
+            lambda: anyio.to_thread.current_default_thread_limiter().total_tokens
+        )
+    assert total_tokens == 7
+
+
+def test_weather_response_matches_encoded_struct():
+    """Test that the documented weather schema matches the encoded struct."""
+    from app.models.weather import WeatherOut, WeatherResponse
+
+    assert tuple(WeatherResponse.model_fields) == WeatherOut.__struct_fields__
+
+
 # Example of parametrized testing
 @pytest.mark.parametrize("city", ["New York", "London", "Tokyo", "Sydney"])
 def test_all_cities_have_weather(client: TestClient, city: str):